@@ -2,11 +2,17 @@ from pydantic import Field
 
 from app.agent.toolcall import ToolCallAgent
 from app.prompt.manus import NEXT_STEP_PROMPT, SYSTEM_PROMPT
-from app.tool import Terminate, ToolCollection, SystemInfoTool, OSAwareFileSaver, SystemInfoSaver
-from app.tool.browser_use_tool import BrowserUseTool
-from app.tool.file_saver import FileSaver
-from app.tool.google_search import GoogleSearch
-from app.tool.python_execute import PythonExecute
+from app.tool import (
+    BrowserUseTool,
+    FileSaver,
+    GoogleSearch,
+    OSAwareFileSaver,
+    PythonExecute,
+    SystemInfoSaver,
+    SystemInfoTool,
+    Terminate,
+    ToolCollection,
+)
 
 
 class Manus(ToolCallAgent):
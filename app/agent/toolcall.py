@@ -50,14 +50,17 @@ class ToolCallAgent(ReActAgent):
         )
         self.tool_calls = response.tool_calls
 
-        # Log response info
-        logger.info(f"✨ {self.name}'s thoughts: {response.content}")
+        # Log response info; args are only formatted if INFO is enabled
+        logger.info("✨ {}'s thoughts: {}", self.name, response.content)
         logger.info(
-            f"🛠️ {self.name} selected {len(response.tool_calls) if response.tool_calls else 0} tools to use"
+            "🛠️ {} selected {} tools to use",
+            self.name,
+            len(response.tool_calls) if response.tool_calls else 0,
         )
         if response.tool_calls:
             logger.info(
-                f"🧰 Tools being prepared: {[call.function.name for call in response.tool_calls]}"
+                "🧰 Tools being prepared: {}",
+                [call.function.name for call in response.tool_calls],
             )
 
         try:
@@ -112,7 +115,9 @@ class ToolCallAgent(ReActAgent):
         for command in self.tool_calls:
             result = await self.execute_tool(command)
             logger.info(
-                f"🎯 Tool '{command.function.name}' completed its mission! Result: {result}"
+                "🎯 Tool '{}' completed its mission! Result: {}",
+                command.function.name,
+                result,
             )
 
             if self.max_observe:
@@ -141,7 +146,7 @@ class ToolCallAgent(ReActAgent):
             args = json.loads(command.function.arguments or "{}")
 
             # Execute the tool
-            logger.info(f"🔧 Activating tool: '{name}'...")
+            logger.info("🔧 Activating tool: '{}'...", name)
             result = await self.available_tools.execute(name=name, tool_input=args)
 
             # Format result for display
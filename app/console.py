@@ -0,0 +1,73 @@
+import asyncio
+import os
+import sys
+from typing import Optional
+
+
+# Bytes read from stdin that have not been returned as a line yet
+_pending = bytearray()
+
+
+def _take_line(at_eof: bool = False) -> Optional[str]:
+    """Pop the next complete line (or, at EOF, whatever is left) from the buffer."""
+    end = _pending.find(b"\n")
+    if end < 0:
+        if not (at_eof and _pending):
+            return None
+        end = len(_pending) - 1
+    line = bytes(_pending[: end + 1])
+    del _pending[: end + 1]
+    # Decode the way input() would, honouring e.g. errors="surrogateescape"
+    encoding = sys.stdin.encoding or "utf-8"
+    return line.decode(encoding, sys.stdin.errors or "strict").rstrip("\r\n")
+
+
+async def ainput(prompt: str = "") -> str:
+    """
+    Read a line from stdin without blocking the event loop.
+
+    On POSIX the stdin file descriptor is watched with loop.add_reader, so no
+    thread is ever left blocked in input(): a Ctrl-C at the prompt simply
+    cancels the awaiting task. Where stdin cannot be watched (Windows, or a
+    regular file redirected to stdin) this falls back to input() in a worker
+    thread.
+
+    Raises:
+        EOFError: If stdin is exhausted before a line is read.
+    """
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+
+    line = _take_line()
+    if line is not None:
+        return line
+
+    loop = asyncio.get_running_loop()
+    fd = sys.stdin.fileno()
+    future = loop.create_future()
+
+    def _on_readable():
+        if future.done():
+            return
+        try:
+            chunk = os.read(fd, 4096)
+            _pending.extend(chunk)
+            line = _take_line(at_eof=not chunk)
+        except BaseException as e:
+            # Surface read/decode errors to the caller; resolving the future
+            # also unregisters the reader so a dead fd cannot spin here
+            future.set_exception(e)
+            return
+        if line is not None:
+            future.set_result(line)
+        elif not chunk:
+            future.set_exception(EOFError())
+
+    try:
+        loop.add_reader(fd, _on_readable)
+    except (NotImplementedError, PermissionError):
+        return await asyncio.to_thread(input)
+    try:
+        return await future
+    finally:
+        loop.remove_reader(fd)
@@ -1,20 +1,52 @@
-from typing import Dict, List, Literal, Optional, Union
+import asyncio
+import functools
+import hashlib
+import io
+import random
+from typing import Awaitable, Callable, Dict, List, Literal, Optional, TypeVar, Union
 
 from openai import (
+    APIConnectionError,
     APIError,
     AsyncAzureOpenAI,
     AsyncOpenAI,
     AuthenticationError,
+    InternalServerError,
     OpenAIError,
     RateLimitError,
 )
-from tenacity import retry, stop_after_attempt, wait_random_exponential
 
 from app.config import LLMSettings, config
 from app.logger import logger  # Assuming a logger is set up in your app
 from app.schema import Message
 
 
+T = TypeVar("T")
+
+ROLE_VALUES = frozenset({"system", "user", "assistant", "tool"})
+TOOL_CHOICE_VALUES = frozenset({"none", "auto", "required"})
+
+# Transient API failures worth retrying (APITimeoutError is an APIConnectionError)
+RETRYABLE_ERRORS = (APIConnectionError, RateLimitError, InternalServerError)
+
+# Number of streamed chunks between explicit stdout flushes
+STREAM_FLUSH_EVERY = 16
+
+
+@functools.lru_cache(maxsize=32)
+def _get_client(
+    api_type: str, base_url: str, api_key: str, api_version: str
+) -> Union[AsyncOpenAI, AsyncAzureOpenAI]:
+    """Return a client shared by every LLM config pointing at the same endpoint."""
+    if api_type == "azure":
+        return AsyncAzureOpenAI(
+            base_url=base_url,
+            api_key=api_key,
+            api_version=api_version,
+        )
+    return AsyncOpenAI(api_key=api_key, base_url=base_url)
+
+
 class LLM:
     _instances: Dict[str, "LLM"] = {}
 
@@ -40,14 +72,42 @@ class LLM:
             self.api_key = llm_config.api_key
             self.api_version = llm_config.api_version
             self.base_url = llm_config.base_url
-            if self.api_type == "azure":
-                self.client = AsyncAzureOpenAI(
-                    base_url=self.base_url,
-                    api_key=self.api_key,
-                    api_version=self.api_version,
-                )
-            else:
-                self.client = AsyncOpenAI(api_key=self.api_key, base_url=self.base_url)
+            self.client = _get_client(
+                self.api_type, self.base_url, self.api_key, self.api_version
+            )
+            # Prompt-cache accounting, fed from response.usage. Streaming `ask`
+            # calls report no usage, so these cover ask_tool and non-streaming
+            # ask only.
+            self.total_input_tokens = 0
+            self.total_cached_tokens = 0
+
+    @staticmethod
+    def _prompt_cache_key(system_msgs: Optional[List[dict]]) -> Optional[str]:
+        """Derive a stable cache key from the static system prefix of a request."""
+        if not system_msgs:
+            return None
+        prefix = "".join(str(msg.get("content") or "") for msg in system_msgs)
+        return hashlib.sha256(prefix.encode("utf-8")).hexdigest()[:32]
+
+    def _record_cache_usage(self, usage) -> None:
+        """
+        Accumulate prompt and cached token counts reported by the API.
+
+        Only called for non-streaming responses (ask_tool and ask with
+        stream=False); streamed completions are not counted.
+        """
+        if usage is None:
+            return
+        details = getattr(usage, "prompt_tokens_details", None)
+        self.total_input_tokens += usage.prompt_tokens
+        self.total_cached_tokens += getattr(details, "cached_tokens", None) or 0
+        if self.total_input_tokens:
+            logger.debug(
+                "Prompt cache: {}/{} input tokens served from cache ({:.1%})",
+                self.total_cached_tokens,
+                self.total_input_tokens,
+                self.total_cached_tokens / self.total_input_tokens,
+            )
 
     @staticmethod
     def format_messages(messages: List[Union[dict, Message]]) -> List[dict]:
@@ -74,33 +134,54 @@ class LLM:
         """
         formatted_messages = []
 
+        # Convert and validate in a single pass over the history
         for message in messages:
             if isinstance(message, dict):
                 # If message is already a dict, ensure it has required fields
                 if "role" not in message:
                     raise ValueError("Message dict must contain 'role' field")
-                formatted_messages.append(message)
+                msg = message
             elif isinstance(message, Message):
                 # If message is a Message object, convert it to dict
-                formatted_messages.append(message.to_dict())
+                msg = message.to_dict()
             else:
                 raise TypeError(f"Unsupported message type: {type(message)}")
 
-        # Validate all messages have required fields
-        for msg in formatted_messages:
-            if msg["role"] not in ["system", "user", "assistant", "tool"]:
+            if msg["role"] not in ROLE_VALUES:
                 raise ValueError(f"Invalid role: {msg['role']}")
             if "content" not in msg and "tool_calls" not in msg:
                 raise ValueError(
                     "Message must contain either 'content' or 'tool_calls'"
                 )
+            formatted_messages.append(msg)
 
         return formatted_messages
 
-    @retry(
-        wait=wait_random_exponential(min=1, max=60),
-        stop=stop_after_attempt(6),
-    )
+    @staticmethod
+    async def _with_retry(
+        coro_fn: Callable[[], Awaitable[T]],
+        *,
+        attempts: int = 6,
+        min_wait: float = 1,
+        max_wait: float = 60,
+    ) -> T:
+        """
+        Await coro_fn(), retrying transient API errors with random exponential backoff.
+
+        Only connection/timeout, rate-limit and server errors are retried;
+        authentication, bad-request and other client errors, as well as
+        validation errors, propagate immediately since repeating the request
+        cannot fix them.
+        """
+        for attempt in range(attempts):
+            try:
+                return await coro_fn()
+            except RETRYABLE_ERRORS:
+                if attempt == attempts - 1:
+                    raise
+                backoff = min(max_wait, min_wait * 2 ** (attempt + 1))
+                await asyncio.sleep(random.uniform(min_wait, backoff))
+
     async def ask(
         self,
         messages: List[Union[dict, Message]],
@@ -125,6 +206,18 @@ class LLM:
             OpenAIError: If API call fails after retries
             Exception: For unexpected errors
         """
+        return await self._with_retry(
+            lambda: self._ask(messages, system_msgs, stream, temperature)
+        )
+
+    async def _ask(
+        self,
+        messages: List[Union[dict, Message]],
+        system_msgs: Optional[List[Union[dict, Message]]],
+        stream: bool,
+        temperature: Optional[float],
+    ) -> str:
+        """Single attempt of `ask`."""
         try:
             # Format system and user messages
             if system_msgs:
@@ -133,6 +226,12 @@ class LLM:
             else:
                 messages = self.format_messages(messages)
 
+            # Key requests on the static system prefix so it hits the prompt cache
+            params = {}
+            cache_key = self._prompt_cache_key(system_msgs)
+            if cache_key:
+                params["user"] = cache_key
+
             if not stream:
                 # Non-streaming request
                 response = await self.client.chat.completions.create(
@@ -141,7 +240,9 @@ class LLM:
                     max_tokens=self.max_tokens,
                     temperature=temperature or self.temperature,
                     stream=False,
+                    **params,
                 )
+                self._record_cache_usage(response.usage)
                 if not response.choices or not response.choices[0].message.content:
                     raise ValueError("Empty or invalid response from LLM")
                 return response.choices[0].message.content
@@ -153,16 +254,22 @@ class LLM:
                 max_tokens=self.max_tokens,
                 temperature=temperature or self.temperature,
                 stream=True,
+                **params,
             )
 
-            collected_messages = []
+            buffer = io.StringIO()
+            chunk_count = 0
             async for chunk in response:
                 chunk_message = chunk.choices[0].delta.content or ""
-                collected_messages.append(chunk_message)
-                print(chunk_message, end="", flush=True)
+                buffer.write(chunk_message)
+                chunk_count += 1
+                # Flushing stdout on every token is a syscall per chunk
+                print(
+                    chunk_message, end="", flush=chunk_count % STREAM_FLUSH_EVERY == 0
+                )
 
-            print()  # Newline after streaming
-            full_response = "".join(collected_messages).strip()
+            print(flush=True)  # Newline after streaming
+            full_response = buffer.getvalue().strip()
             if not full_response:
                 raise ValueError("Empty response from streaming LLM")
             return full_response
@@ -177,10 +284,6 @@ class LLM:
             logger.error(f"Unexpected error in ask: {e}")
             raise
 
-    @retry(
-        wait=wait_random_exponential(min=1, max=60),
-        stop=stop_after_attempt(6),
-    )
     async def ask_tool(
         self,
         messages: List[Union[dict, Message]],
@@ -211,9 +314,32 @@ class LLM:
             OpenAIError: If API call fails after retries
             Exception: For unexpected errors
         """
+        return await self._with_retry(
+            lambda: self._ask_tool(
+                messages,
+                system_msgs,
+                timeout,
+                tools,
+                tool_choice,
+                temperature,
+                **kwargs,
+            )
+        )
+
+    async def _ask_tool(
+        self,
+        messages: List[Union[dict, Message]],
+        system_msgs: Optional[List[Union[dict, Message]]],
+        timeout: int,
+        tools: Optional[List[dict]],
+        tool_choice: Literal["none", "auto", "required"],
+        temperature: Optional[float],
+        **kwargs,
+    ):
+        """Single attempt of `ask_tool`."""
         try:
             # Validate tool_choice
-            if tool_choice not in ["none", "auto", "required"]:
+            if tool_choice not in TOOL_CHOICE_VALUES:
                 raise ValueError(f"Invalid tool_choice: {tool_choice}")
 
             # Format messages
@@ -229,6 +355,11 @@ class LLM:
                     if not isinstance(tool, dict) or "type" not in tool:
                         raise ValueError("Each tool must be a dict with 'type' field")
 
+            # Key requests on the static system prefix so it hits the prompt cache
+            cache_key = self._prompt_cache_key(system_msgs)
+            if cache_key:
+                kwargs.setdefault("user", cache_key)
+
             # Set up the completion request
             response = await self.client.chat.completions.create(
                 model=self.model,
@@ -240,6 +371,7 @@ class LLM:
                 timeout=timeout,
                 **kwargs,
             )
+            self._record_cache_usage(response.usage)
 
             # Check if response is valid
             if not response.choices or not response.choices[0].message:
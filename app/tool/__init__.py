@@ -1,24 +1,58 @@
-from app.tool.base import BaseTool
-from app.tool.bash import Bash
-from app.tool.create_chat_completion import CreateChatCompletion
-from app.tool.os_aware_file_saver import OSAwareFileSaver
-from app.tool.planning import PlanningTool
-from app.tool.str_replace_editor import StrReplaceEditor
-from app.tool.system_info import SystemInfoTool
-from app.tool.system_info_saver import SystemInfoSaver
-from app.tool.terminate import Terminate
-from app.tool.tool_collection import ToolCollection
-
-
-__all__ = [
-    "BaseTool",
-    "Bash",
-    "Terminate",
-    "StrReplaceEditor",
-    "ToolCollection",
-    "CreateChatCompletion",
-    "PlanningTool",
-    "SystemInfoTool",
-    "OSAwareFileSaver",
-    "SystemInfoSaver",
-]
+import importlib
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from app.tool.base import BaseTool
+    from app.tool.bash import Bash
+    from app.tool.browser_use_tool import BrowserUseTool
+    from app.tool.create_chat_completion import CreateChatCompletion
+    from app.tool.file_saver import FileSaver
+    from app.tool.google_search import GoogleSearch
+    from app.tool.os_aware_file_saver import OSAwareFileSaver
+    from app.tool.planning import PlanningTool
+    from app.tool.python_execute import PythonExecute
+    from app.tool.str_replace_editor import StrReplaceEditor
+    from app.tool.system_info import SystemInfoTool
+    from app.tool.system_info_saver import SystemInfoSaver
+    from app.tool.terminate import Terminate
+    from app.tool.tool_collection import ToolCollection
+
+
+# Registry of every public tool: exported name -> (module path, attribute).
+# Tools are imported on first attribute access (PEP 562) so that importing
+# app.tool does not pull in Playwright, psutil and friends for tools that
+# are never used.
+_TOOLS = {
+    "BaseTool": ("app.tool.base", "BaseTool"),
+    "Bash": ("app.tool.bash", "Bash"),
+    "BrowserUseTool": ("app.tool.browser_use_tool", "BrowserUseTool"),
+    "CreateChatCompletion": ("app.tool.create_chat_completion", "CreateChatCompletion"),
+    "FileSaver": ("app.tool.file_saver", "FileSaver"),
+    "GoogleSearch": ("app.tool.google_search", "GoogleSearch"),
+    "OSAwareFileSaver": ("app.tool.os_aware_file_saver", "OSAwareFileSaver"),
+    "PlanningTool": ("app.tool.planning", "PlanningTool"),
+    "PythonExecute": ("app.tool.python_execute", "PythonExecute"),
+    "StrReplaceEditor": ("app.tool.str_replace_editor", "StrReplaceEditor"),
+    "SystemInfoSaver": ("app.tool.system_info_saver", "SystemInfoSaver"),
+    "SystemInfoTool": ("app.tool.system_info", "SystemInfoTool"),
+    "Terminate": ("app.tool.terminate", "Terminate"),
+    "ToolCollection": ("app.tool.tool_collection", "ToolCollection"),
+}
+
+
+__all__ = tuple(_TOOLS)
+
+
+def __getattr__(name: str):
+    try:
+        module_path, attr = _TOOLS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_path), attr)
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_TOOLS))
@@ -1,24 +1,39 @@
 import asyncio
-import json
-from typing import Optional
+from typing import Awaitable, Callable, ClassVar, Dict, Optional, Set
 
 from browser_use import Browser as BrowserUseBrowser
 from browser_use import BrowserConfig
 from browser_use.browser.context import BrowserContext
 from browser_use.dom.service import DomService
-from pydantic import Field, field_validator
-from pydantic_core.core_schema import ValidationInfo
+from pydantic import Field
 
 from app.tool.base import BaseTool, ToolResult
 
 
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+    import json
+
+    def _dumps(obj) -> str:
+        return json.dumps(obj, ensure_ascii=False)
+
+
+# asyncio only keeps weak references to tasks; hold cleanup tasks scheduled
+# from __del__ until they finish so they are not collected mid-flight.
+_CLEANUP_TASKS: Set[asyncio.Task] = set()
+
 _BROWSER_DESCRIPTION = """
 Interact with a web browser to perform various actions such as navigation, element interaction,
 content extraction, and tab management. Supported actions include:
 - 'navigate': Go to a specific URL (can open in current tab or new tab)
 - 'click': Click an element by index
 - 'input_text': Input text into an element
-- 'screenshot': Capture a screenshot
+- 'screenshot': Capture a screenshot (visible viewport unless 'full_page' is set)
 - 'get_html': Get page HTML content
 - 'get_text': Get text content of the page
 - 'read_links': Get all links on the page
@@ -30,81 +45,84 @@ content extraction, and tab management. Supported actions include:
 - 'refresh': Refresh the current page
 """
 
+# Static JSON schema shared by every instance; the default_factory hands out this
+# one dict instead of letting pydantic deep-copy it per tool instance.
+_BROWSER_PARAMETERS = {
+    "type": "object",
+    "properties": {
+        "action": {
+            "type": "string",
+            "enum": [
+                "navigate",
+                "click",
+                "input_text",
+                "screenshot",
+                "get_html",
+                "get_text",
+                "execute_js",
+                "scroll",
+                "switch_tab",
+                "new_tab",
+                "close_tab",
+                "refresh",
+            ],
+            "description": "The browser action to perform",
+        },
+        "url": {
+            "type": "string",
+            "description": "URL for 'navigate' or 'new_tab' actions",
+        },
+        "index": {
+            "type": "integer",
+            "description": "Element index for 'click' or 'input_text' actions",
+        },
+        "text": {"type": "string", "description": "Text for 'input_text' action"},
+        "script": {
+            "type": "string",
+            "description": "JavaScript code for 'execute_js' action",
+        },
+        "scroll_amount": {
+            "type": "integer",
+            "description": "Pixels to scroll (positive for down, negative for up) for 'scroll' action",
+        },
+        "tab_id": {
+            "type": "integer",
+            "description": "Tab ID for 'switch_tab' action",
+        },
+        "new_tab_for_navigate": {
+            "type": "boolean",
+            "description": "Whether to open URL in a new tab for 'navigate' action (default: false)",
+            "default": False,
+        },
+        "full_page": {
+            "type": "boolean",
+            "description": "Whether to capture the whole scrollable page instead of the visible viewport for 'screenshot' action (default: false)",
+            "default": False,
+        },
+    },
+    "required": ["action"],
+    "dependencies": {
+        "navigate": ["url"],
+        "click": ["index"],
+        "input_text": ["index", "text"],
+        "execute_js": ["script"],
+        "switch_tab": ["tab_id"],
+        "new_tab": ["url"],
+        "scroll": ["scroll_amount"],
+    },
+}
+
 
 class BrowserUseTool(BaseTool):
     name: str = "browser_use"
     description: str = _BROWSER_DESCRIPTION
-    parameters: dict = {
-        "type": "object",
-        "properties": {
-            "action": {
-                "type": "string",
-                "enum": [
-                    "navigate",
-                    "click",
-                    "input_text",
-                    "screenshot",
-                    "get_html",
-                    "get_text",
-                    "execute_js",
-                    "scroll",
-                    "switch_tab",
-                    "new_tab",
-                    "close_tab",
-                    "refresh",
-                ],
-                "description": "The browser action to perform",
-            },
-            "url": {
-                "type": "string",
-                "description": "URL for 'navigate' or 'new_tab' actions",
-            },
-            "index": {
-                "type": "integer",
-                "description": "Element index for 'click' or 'input_text' actions",
-            },
-            "text": {"type": "string", "description": "Text for 'input_text' action"},
-            "script": {
-                "type": "string",
-                "description": "JavaScript code for 'execute_js' action",
-            },
-            "scroll_amount": {
-                "type": "integer",
-                "description": "Pixels to scroll (positive for down, negative for up) for 'scroll' action",
-            },
-            "tab_id": {
-                "type": "integer",
-                "description": "Tab ID for 'switch_tab' action",
-            },
-            "new_tab_for_navigate": {
-                "type": "boolean",
-                "description": "Whether to open URL in a new tab for 'navigate' action (default: false)",
-                "default": False,
-            },
-        },
-        "required": ["action"],
-        "dependencies": {
-            "navigate": ["url"],
-            "click": ["index"],
-            "input_text": ["index", "text"],
-            "execute_js": ["script"],
-            "switch_tab": ["tab_id"],
-            "new_tab": ["url"],
-            "scroll": ["scroll_amount"],
-        },
-    }
+    parameters: dict = Field(default_factory=lambda: _BROWSER_PARAMETERS)
 
     lock: asyncio.Lock = Field(default_factory=asyncio.Lock)
     browser: Optional[BrowserUseBrowser] = Field(default=None, exclude=True)
     context: Optional[BrowserContext] = Field(default=None, exclude=True)
     dom_service: Optional[DomService] = Field(default=None, exclude=True)
 
-    @field_validator("parameters", mode="before")
-    def validate_parameters(cls, v: dict, info: ValidationInfo) -> dict:
-        if not v:
-            raise ValueError("Parameters cannot be empty")
-        return v
-
     async def _ensure_browser_initialized(self) -> BrowserContext:
         """Ensure browser and context are initialized."""
         if self.browser is None:
@@ -129,6 +147,7 @@ class BrowserUseTool(BaseTool):
         scroll_amount: Optional[int] = None,
         tab_id: Optional[int] = None,
         new_tab_for_navigate: bool = False,
+        full_page: bool = False,
         **kwargs,
     ) -> ToolResult:
         """
@@ -143,124 +162,166 @@ class BrowserUseTool(BaseTool):
             scroll_amount: Pixels to scroll for scroll action
             tab_id: Tab ID for switch_tab action
             new_tab_for_navigate: Whether to open URL in a new tab for 'navigate' action
+            full_page: Whether to capture the whole page for screenshot action
             **kwargs: Additional arguments
 
         Returns:
             ToolResult with the action's output or error
         """
+        handler = self._ACTION_HANDLERS.get(action)
+        if handler is None:
+            return ToolResult(error=f"Unknown action: {action}")
+
         async with self.lock:
             try:
                 context = await self._ensure_browser_initialized()
-
-                if action == "navigate":
-                    if not url:
-                        return ToolResult(error="URL is required for 'navigate' action")
-                    
-                    # 如果指定了在新标签页中打开，则使用create_new_tab方法
-                    if new_tab_for_navigate:
-                        await context.create_new_tab(url)
-                        return ToolResult(output=f"Opened {url} in a new tab")
-                    else:
-                        # 否则使用原来的navigate_to方法
-                        await context.navigate_to(url)
-                        return ToolResult(output=f"Navigated to {url} in current tab")
-
-                elif action == "click":
-                    if index is None:
-                        return ToolResult(error="Index is required for 'click' action")
-                    element = await context.get_dom_element_by_index(index)
-                    if not element:
-                        return ToolResult(error=f"Element with index {index} not found")
-                    download_path = await context._click_element_node(element)
-                    output = f"Clicked element at index {index}"
-                    if download_path:
-                        output += f" - Downloaded file to {download_path}"
-                    return ToolResult(output=output)
-
-                elif action == "input_text":
-                    if index is None or not text:
-                        return ToolResult(
-                            error="Index and text are required for 'input_text' action"
-                        )
-                    element = await context.get_dom_element_by_index(index)
-                    if not element:
-                        return ToolResult(error=f"Element with index {index} not found")
-                    await context._input_text_element_node(element, text)
-                    return ToolResult(
-                        output=f"Input '{text}' into element at index {index}"
-                    )
-
-                elif action == "screenshot":
-                    screenshot = await context.take_screenshot(full_page=True)
-                    return ToolResult(
-                        output=f"Screenshot captured (base64 length: {len(screenshot)})",
-                        system=screenshot,
-                    )
-
-                elif action == "get_html":
-                    html = await context.get_page_html()
-                    truncated = html[:2000] + "..." if len(html) > 2000 else html
-                    return ToolResult(output=truncated)
-
-                elif action == "get_text":
-                    text = await context.execute_javascript("document.body.innerText")
-                    return ToolResult(output=text)
-
-                elif action == "read_links":
-                    links = await context.execute_javascript(
-                        "document.querySelectorAll('a[href]').forEach((elem) => {if (elem.innerText) {console.log(elem.innerText, elem.href)}})"
-                    )
-                    return ToolResult(output=links)
-
-                elif action == "execute_js":
-                    if not script:
-                        return ToolResult(
-                            error="Script is required for 'execute_js' action"
-                        )
-                    result = await context.execute_javascript(script)
-                    return ToolResult(output=str(result))
-
-                elif action == "scroll":
-                    if scroll_amount is None:
-                        return ToolResult(
-                            error="Scroll amount is required for 'scroll' action"
-                        )
-                    await context.execute_javascript(
-                        f"window.scrollBy(0, {scroll_amount});"
-                    )
-                    direction = "down" if scroll_amount > 0 else "up"
-                    return ToolResult(
-                        output=f"Scrolled {direction} by {abs(scroll_amount)} pixels"
-                    )
-
-                elif action == "switch_tab":
-                    if tab_id is None:
-                        return ToolResult(
-                            error="Tab ID is required for 'switch_tab' action"
-                        )
-                    await context.switch_to_tab(tab_id)
-                    return ToolResult(output=f"Switched to tab {tab_id}")
-
-                elif action == "new_tab":
-                    if not url:
-                        return ToolResult(error="URL is required for 'new_tab' action")
-                    await context.create_new_tab(url)
-                    return ToolResult(output=f"Opened new tab with URL {url}")
-
-                elif action == "close_tab":
-                    await context.close_current_tab()
-                    return ToolResult(output="Closed current tab")
-
-                elif action == "refresh":
-                    await context.refresh_page()
-                    return ToolResult(output="Refreshed current page")
-
-                else:
-                    return ToolResult(error=f"Unknown action: {action}")
-
+                return await handler(
+                    self,
+                    context,
+                    url=url,
+                    index=index,
+                    text=text,
+                    script=script,
+                    scroll_amount=scroll_amount,
+                    tab_id=tab_id,
+                    new_tab_for_navigate=new_tab_for_navigate,
+                    full_page=full_page,
+                )
             except Exception as e:
                 return ToolResult(error=f"Browser action '{action}' failed: {str(e)}")
 
+    async def _navigate(
+        self,
+        context: BrowserContext,
+        url: Optional[str] = None,
+        new_tab_for_navigate: bool = False,
+        **kwargs,
+    ) -> ToolResult:
+        if not url:
+            return ToolResult(error="URL is required for 'navigate' action")
+
+        # 如果指定了在新标签页中打开，则使用create_new_tab方法
+        if new_tab_for_navigate:
+            await context.create_new_tab(url)
+            return ToolResult(output=f"Opened {url} in a new tab")
+        # 否则使用原来的navigate_to方法
+        await context.navigate_to(url)
+        return ToolResult(output=f"Navigated to {url} in current tab")
+
+    async def _click(
+        self, context: BrowserContext, index: Optional[int] = None, **kwargs
+    ) -> ToolResult:
+        if index is None:
+            return ToolResult(error="Index is required for 'click' action")
+        element = await context.get_dom_element_by_index(index)
+        if not element:
+            return ToolResult(error=f"Element with index {index} not found")
+        download_path = await context._click_element_node(element)
+        output = f"Clicked element at index {index}"
+        if download_path:
+            output += f" - Downloaded file to {download_path}"
+        return ToolResult(output=output)
+
+    async def _input_text(
+        self,
+        context: BrowserContext,
+        index: Optional[int] = None,
+        text: Optional[str] = None,
+        **kwargs,
+    ) -> ToolResult:
+        if index is None or not text:
+            return ToolResult(
+                error="Index and text are required for 'input_text' action"
+            )
+        element = await context.get_dom_element_by_index(index)
+        if not element:
+            return ToolResult(error=f"Element with index {index} not found")
+        await context._input_text_element_node(element, text)
+        return ToolResult(output=f"Input '{text}' into element at index {index}")
+
+    async def _screenshot(
+        self, context: BrowserContext, full_page: bool = False, **kwargs
+    ) -> ToolResult:
+        # Viewport captures are a fraction of the size of full-page renders
+        screenshot = await context.take_screenshot(full_page=full_page)
+        return ToolResult(
+            output=f"Screenshot captured (base64 length: {len(screenshot)})",
+            system=screenshot,
+        )
+
+    async def _get_html(self, context: BrowserContext, **kwargs) -> ToolResult:
+        html = await context.get_page_html()
+        truncated = html[:2000] + "..." if len(html) > 2000 else html
+        return ToolResult(output=truncated)
+
+    async def _get_text(self, context: BrowserContext, **kwargs) -> ToolResult:
+        text = await context.execute_javascript("document.body.innerText")
+        return ToolResult(output=text)
+
+    async def _read_links(self, context: BrowserContext, **kwargs) -> ToolResult:
+        links = await context.execute_javascript(
+            "document.querySelectorAll('a[href]').forEach((elem) => {if (elem.innerText) {console.log(elem.innerText, elem.href)}})"
+        )
+        return ToolResult(output=links)
+
+    async def _execute_js(
+        self, context: BrowserContext, script: Optional[str] = None, **kwargs
+    ) -> ToolResult:
+        if not script:
+            return ToolResult(error="Script is required for 'execute_js' action")
+        result = await context.execute_javascript(script)
+        return ToolResult(output=str(result))
+
+    async def _scroll(
+        self, context: BrowserContext, scroll_amount: Optional[int] = None, **kwargs
+    ) -> ToolResult:
+        if scroll_amount is None:
+            return ToolResult(error="Scroll amount is required for 'scroll' action")
+        await context.execute_javascript(f"window.scrollBy(0, {scroll_amount});")
+        direction = "down" if scroll_amount > 0 else "up"
+        return ToolResult(output=f"Scrolled {direction} by {abs(scroll_amount)} pixels")
+
+    async def _switch_tab(
+        self, context: BrowserContext, tab_id: Optional[int] = None, **kwargs
+    ) -> ToolResult:
+        if tab_id is None:
+            return ToolResult(error="Tab ID is required for 'switch_tab' action")
+        await context.switch_to_tab(tab_id)
+        return ToolResult(output=f"Switched to tab {tab_id}")
+
+    async def _new_tab(
+        self, context: BrowserContext, url: Optional[str] = None, **kwargs
+    ) -> ToolResult:
+        if not url:
+            return ToolResult(error="URL is required for 'new_tab' action")
+        await context.create_new_tab(url)
+        return ToolResult(output=f"Opened new tab with URL {url}")
+
+    async def _close_tab(self, context: BrowserContext, **kwargs) -> ToolResult:
+        await context.close_current_tab()
+        return ToolResult(output="Closed current tab")
+
+    async def _refresh(self, context: BrowserContext, **kwargs) -> ToolResult:
+        await context.refresh_page()
+        return ToolResult(output="Refreshed current page")
+
+    # Action name -> handler, looked up once per execute() call
+    _ACTION_HANDLERS: ClassVar[Dict[str, Callable[..., Awaitable[ToolResult]]]] = {
+        "navigate": _navigate,
+        "click": _click,
+        "input_text": _input_text,
+        "screenshot": _screenshot,
+        "get_html": _get_html,
+        "get_text": _get_text,
+        "read_links": _read_links,
+        "execute_js": _execute_js,
+        "scroll": _scroll,
+        "switch_tab": _switch_tab,
+        "new_tab": _new_tab,
+        "close_tab": _close_tab,
+        "refresh": _refresh,
+    }
+
     async def get_current_state(self) -> ToolResult:
         """Get the current browser state as a ToolResult."""
         async with self.lock:
@@ -273,7 +334,7 @@ class BrowserUseTool(BaseTool):
                     "tabs": [tab.model_dump() for tab in state.tabs],
                     "interactive_elements": state.element_tree.clickable_elements_to_string(),
                 }
-                return ToolResult(output=json.dumps(state_info))
+                return ToolResult(output=_dumps(state_info))
             except Exception as e:
                 return ToolResult(error=f"Failed to get browser state: {str(e)}")
 
@@ -290,10 +351,14 @@ class BrowserUseTool(BaseTool):
 
     def __del__(self):
         """Ensure cleanup when object is destroyed."""
-        if self.browser is not None or self.context is not None:
-            try:
-                asyncio.run(self.cleanup())
-            except RuntimeError:
-                loop = asyncio.new_event_loop()
-                loop.run_until_complete(self.cleanup())
-                loop.close()
+        if self.browser is None and self.context is None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop running: asyncio.run owns loop creation and teardown
+            asyncio.run(self.cleanup())
+        else:
+            task = loop.create_task(self.cleanup())
+            _CLEANUP_TASKS.add(task)
+            task.add_done_callback(_CLEANUP_TASKS.discard)
@@ -1,9 +1,9 @@
 import os
-import platform
 
 import aiofiles
 
 from app.tool.base import BaseTool
+from app.tool.system_utils import CURRENT_OS, DOCUMENTS_DIR
 
 
 class OSAwareFileSaver(BaseTool):
@@ -46,13 +46,13 @@ class OSAwareFileSaver(BaseTool):
     }
 
     async def execute(
-        self, 
-        content: str, 
-        file_name: str, 
-        windows_path: str = None, 
-        macos_path: str = None, 
-        linux_path: str = None, 
-        mode: str = "w"
+        self,
+        content: str,
+        file_name: str,
+        windows_path: str = None,
+        macos_path: str = None,
+        linux_path: str = None,
+        mode: str = "w",
     ) -> str:
         """
         根据操作系统类型保存内容到文件。
@@ -70,35 +70,35 @@ class OSAwareFileSaver(BaseTool):
         """
         try:
             # 获取当前操作系统类型
-            current_os = platform.system()
-            
+            current_os = CURRENT_OS
+
             # 根据操作系统类型选择保存路径
             if current_os == "Windows":
-                base_path = windows_path or os.path.join(os.path.expanduser("~"), "Documents")
+                base_path = windows_path or DOCUMENTS_DIR
                 path_separator = "\\"
             elif current_os == "Darwin":  # macOS
-                base_path = macos_path or os.path.join(os.path.expanduser("~"), "Documents")
+                base_path = macos_path or DOCUMENTS_DIR
                 path_separator = "/"
             elif current_os == "Linux":
-                base_path = linux_path or os.path.join(os.path.expanduser("~"), "Documents")
+                base_path = linux_path or DOCUMENTS_DIR
                 path_separator = "/"
             else:
                 # 未知操作系统，使用当前目录
                 base_path = "."
                 path_separator = os.path.sep
-            
+
             # 构建完整的文件路径
             file_path = os.path.join(base_path, file_name)
-            
+
             # 确保目录存在
             directory = os.path.dirname(file_path)
             if directory and not os.path.exists(directory):
                 os.makedirs(directory)
-            
+
             # 写入文件
             async with aiofiles.open(file_path, mode, encoding="utf-8") as file:
                 await file.write(content)
-            
+
             return f"内容已成功保存到 {file_path}（操作系统：{current_os}）"
         except Exception as e:
-            return f"保存文件时出错: {str(e)}" 
\ No newline at end of file
+            return f"保存文件时出错: {str(e)}"
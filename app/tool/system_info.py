@@ -1,10 +1,20 @@
-import platform
-import os
 import psutil
-import json
-from typing import Dict, Optional
 
 from app.tool.base import BaseTool, ToolResult
+from app.tool.system_utils import format_bytes, get_static_os_info
+
+
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+
+except ImportError:
+    import json
+
+    def _dumps(obj) -> str:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
 
 
 class SystemInfoTool(BaseTool):
@@ -51,32 +61,25 @@ class SystemInfoTool(BaseTool):
         """
         try:
             info = {}
-            
+
             # 获取操作系统信息
             if info_type in ["os", "all"]:
-                info["os"] = {
-                    "system": platform.system(),
-                    "release": platform.release(),
-                    "version": platform.version(),
-                    "machine": platform.machine(),
-                    "processor": platform.processor(),
-                    "platform": platform.platform(),
-                    "node": platform.node(),
-                }
-            
+                info["os"] = get_static_os_info()
+
             # 获取CPU信息
             if info_type in ["cpu", "all"]:
+                freq = psutil.cpu_freq()  # One sysfs read for current/min/max
                 info["cpu"] = {
                     "physical_cores": psutil.cpu_count(logical=False),
                     "total_cores": psutil.cpu_count(logical=True),
                     "cpu_percent": psutil.cpu_percent(),
                     "cpu_freq": {
-                        "current": getattr(psutil.cpu_freq(), "current", None),
-                        "min": getattr(psutil.cpu_freq(), "min", None),
-                        "max": getattr(psutil.cpu_freq(), "max", None),
+                        "current": getattr(freq, "current", None),
+                        "min": getattr(freq, "min", None),
+                        "max": getattr(freq, "max", None),
                     },
                 }
-            
+
             # 获取内存信息
             if info_type in ["memory", "all"]:
                 mem = psutil.virtual_memory()
@@ -86,69 +89,72 @@ class SystemInfoTool(BaseTool):
                     "used": mem.used,
                     "percent": mem.percent,
                 }
-            
+
             # 获取磁盘信息
             if info_type in ["disk", "all"]:
-                disk = psutil.disk_usage('/')
+                disk = psutil.disk_usage("/")
                 info["disk"] = {
                     "total": disk.total,
                     "used": disk.used,
                     "free": disk.free,
                     "percent": disk.percent,
                 }
-            
+
             # 根据格式返回结果
             if format == "json":
-                return ToolResult(output=json.dumps(info, indent=2, ensure_ascii=False))
+                return ToolResult(output=_dumps(info))
             else:
-                # 文本格式
-                text_result = ""
-                
+                # 文本格式：逐行收集，最后一次性拼接
+                lines = []
+
                 if "os" in info:
-                    text_result += "操作系统信息:\n"
-                    text_result += f"  系统: {info['os']['system']}\n"
-                    text_result += f"  发行版: {info['os']['release']}\n"
-                    text_result += f"  版本: {info['os']['version']}\n"
-                    text_result += f"  架构: {info['os']['machine']}\n"
-                    text_result += f"  处理器: {info['os']['processor']}\n"
-                    text_result += f"  平台: {info['os']['platform']}\n"
-                    text_result += f"  节点名: {info['os']['node']}\n\n"
-                
+                    lines += [
+                        "操作系统信息:",
+                        f"  系统: {info['os']['system']}",
+                        f"  发行版: {info['os']['release']}",
+                        f"  版本: {info['os']['version']}",
+                        f"  架构: {info['os']['machine']}",
+                        f"  处理器: {info['os']['processor']}",
+                        f"  平台: {info['os']['platform']}",
+                        f"  节点名: {info['os']['node']}",
+                        "",
+                    ]
+
                 if "cpu" in info:
-                    text_result += "CPU信息:\n"
-                    text_result += f"  物理核心数: {info['cpu']['physical_cores']}\n"
-                    text_result += f"  逻辑核心数: {info['cpu']['total_cores']}\n"
-                    text_result += f"  CPU使用率: {info['cpu']['cpu_percent']}%\n"
-                    if info['cpu']['cpu_freq']['current']:
-                        text_result += f"  当前频率: {info['cpu']['cpu_freq']['current']} MHz\n"
-                    if info['cpu']['cpu_freq']['min']:
-                        text_result += f"  最小频率: {info['cpu']['cpu_freq']['min']} MHz\n"
-                    if info['cpu']['cpu_freq']['max']:
-                        text_result += f"  最大频率: {info['cpu']['cpu_freq']['max']} MHz\n\n"
-                
+                    lines.append("CPU信息:")
+                    lines.append(f"  物理核心数: {info['cpu']['physical_cores']}")
+                    lines.append(f"  逻辑核心数: {info['cpu']['total_cores']}")
+                    lines.append(f"  CPU使用率: {info['cpu']['cpu_percent']}%")
+                    if info["cpu"]["cpu_freq"]["current"]:
+                        lines.append(
+                            f"  当前频率: {info['cpu']['cpu_freq']['current']} MHz"
+                        )
+                    if info["cpu"]["cpu_freq"]["min"]:
+                        lines.append(f"  最小频率: {info['cpu']['cpu_freq']['min']} MHz")
+                    if info["cpu"]["cpu_freq"]["max"]:
+                        lines.append(f"  最大频率: {info['cpu']['cpu_freq']['max']} MHz")
+                    lines.append("")
+
                 if "memory" in info:
-                    text_result += "内存信息:\n"
-                    text_result += f"  总内存: {self._format_bytes(info['memory']['total'])}\n"
-                    text_result += f"  可用内存: {self._format_bytes(info['memory']['available'])}\n"
-                    text_result += f"  已用内存: {self._format_bytes(info['memory']['used'])}\n"
-                    text_result += f"  内存使用率: {info['memory']['percent']}%\n\n"
-                
+                    lines += [
+                        "内存信息:",
+                        f"  总内存: {format_bytes(info['memory']['total'])}",
+                        f"  可用内存: {format_bytes(info['memory']['available'])}",
+                        f"  已用内存: {format_bytes(info['memory']['used'])}",
+                        f"  内存使用率: {info['memory']['percent']}%",
+                        "",
+                    ]
+
                 if "disk" in info:
-                    text_result += "磁盘信息:\n"
-                    text_result += f"  总空间: {self._format_bytes(info['disk']['total'])}\n"
-                    text_result += f"  已用空间: {self._format_bytes(info['disk']['used'])}\n"
-                    text_result += f"  可用空间: {self._format_bytes(info['disk']['free'])}\n"
-                    text_result += f"  磁盘使用率: {info['disk']['percent']}%\n"
-                
-                return ToolResult(output=text_result)
-                
+                    lines += [
+                        "磁盘信息:",
+                        f"  总空间: {format_bytes(info['disk']['total'])}",
+                        f"  已用空间: {format_bytes(info['disk']['used'])}",
+                        f"  可用空间: {format_bytes(info['disk']['free'])}",
+                        f"  磁盘使用率: {info['disk']['percent']}%",
+                    ]
+
+                return ToolResult(output="\n".join(lines) + "\n" if lines else "")
+
         except Exception as e:
             return ToolResult(error=f"获取系统信息时出错: {str(e)}")
-    
-    def _format_bytes(self, bytes_value):
-        """将字节数格式化为人类可读的形式"""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if bytes_value < 1024.0:
-                return f"{bytes_value:.2f} {unit}"
-            bytes_value /= 1024.0
-        return f"{bytes_value:.2f} PB" 
\ No newline at end of file
@@ -1,11 +1,156 @@
-import os
-import platform
+import asyncio
 import json
-import psutil
-
-import aiofiles
+import os
 
 from app.tool.base import BaseTool, ToolResult
+from app.tool.system_utils import (
+    CURRENT_OS,
+    DOCUMENTS_DIR,
+    format_bytes,
+    get_static_os_info,
+)
+
+
+def _collect_cpu() -> dict:
+    """采集CPU信息"""
+    import psutil  # psutil 导入较重，只在真正采集时加载
+
+    freq = psutil.cpu_freq()  # One sysfs read for current/min/max
+    return {
+        "physical_cores": psutil.cpu_count(logical=False),
+        "total_cores": psutil.cpu_count(logical=True),
+        "cpu_percent": psutil.cpu_percent(),
+        "cpu_freq": {
+            "current": getattr(freq, "current", None),
+            "min": getattr(freq, "min", None),
+            "max": getattr(freq, "max", None),
+        },
+    }
+
+
+def _collect_memory() -> dict:
+    """采集内存信息"""
+    import psutil
+
+    mem = psutil.virtual_memory()
+    return {
+        "total": mem.total,
+        "available": mem.available,
+        "used": mem.used,
+        "percent": mem.percent,
+    }
+
+
+def _collect_disk() -> dict:
+    """采集磁盘信息"""
+    import psutil
+
+    disk = psutil.disk_usage("/")
+    return {
+        "total": disk.total,
+        "used": disk.used,
+        "free": disk.free,
+        "percent": disk.percent,
+    }
+
+
+# 信息类型 -> 采集函数，顺序即报告中的输出顺序
+_COLLECTORS = {
+    "cpu": _collect_cpu,
+    "memory": _collect_memory,
+    "disk": _collect_disk,
+}
+
+
+def _render_os_text(data: dict, lines: list) -> None:
+    lines += [
+        "操作系统信息:",
+        f"  系统: {data['system']}",
+        f"  发行版: {data['release']}",
+        f"  版本: {data['version']}",
+        f"  架构: {data['machine']}",
+        f"  处理器: {data['processor']}",
+        f"  平台: {data['platform']}",
+        f"  节点名: {data['node']}",
+        "",
+    ]
+
+
+def _render_cpu_text(data: dict, lines: list) -> None:
+    freq = data["cpu_freq"]
+    lines += [
+        "CPU信息:",
+        f"  物理核心数: {data['physical_cores']}",
+        f"  逻辑核心数: {data['total_cores']}",
+        f"  CPU使用率: {data['cpu_percent']}%",
+    ]
+    if freq["current"]:
+        lines.append(f"  当前频率: {freq['current']} MHz")
+    if freq["min"]:
+        lines.append(f"  最小频率: {freq['min']} MHz")
+    if freq["max"]:
+        lines.append(f"  最大频率: {freq['max']} MHz")
+    lines.append("")
+
+
+def _render_memory_text(data: dict, lines: list) -> None:
+    lines += [
+        "内存信息:",
+        f"  总内存: {format_bytes(data['total'])}",
+        f"  可用内存: {format_bytes(data['available'])}",
+        f"  已用内存: {format_bytes(data['used'])}",
+        f"  内存使用率: {data['percent']}%",
+        "",
+    ]
+
+
+def _render_disk_text(data: dict, lines: list) -> None:
+    lines += [
+        "磁盘信息:",
+        f"  总空间: {format_bytes(data['total'])}",
+        f"  已用空间: {format_bytes(data['used'])}",
+        f"  可用空间: {format_bytes(data['free'])}",
+        f"  磁盘使用率: {data['percent']}%",
+    ]
+
+
+# 信息类型 -> 文本渲染函数
+_TEXT_RENDERERS = {
+    "os": _render_os_text,
+    "cpu": _render_cpu_text,
+    "memory": _render_memory_text,
+    "disk": _render_disk_text,
+}
+
+
+def _render_text(info: dict) -> str:
+    """把系统信息渲染为文本报告，只渲染实际采集到的部分"""
+    # 逐行收集，最后一次性拼接
+    lines = []
+    for name, data in info.items():
+        _TEXT_RENDERERS[name](data, lines)
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+def _open_for_write(file_path: str):
+    """确保目录存在后以 UTF-8 文本模式打开文件"""
+    directory = os.path.dirname(file_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    return open(file_path, "w", encoding="utf-8")
+
+
+def _write_text(file_path: str, info: dict) -> None:
+    """在同一个工作线程中完成渲染、建目录、打开和写入，避免多次线程切换"""
+    content = _render_text(info)
+    with _open_for_write(file_path) as file:
+        file.write(content)
+
+
+def _write_json(file_path: str, data: dict) -> None:
+    """直接把 JSON 编码写入文件句柄，不先生成完整字符串"""
+    with _open_for_write(file_path) as file:
+        json.dump(data, file, indent=2, ensure_ascii=False)
 
 
 class SystemInfoSaver(BaseTool):
@@ -77,136 +222,52 @@ class SystemInfoSaver(BaseTool):
             ToolResult: 包含操作结果的信息
         """
         try:
+            # 按格式一次性确定写入函数和扩展名
+            writer, suffix = (
+                (_write_json, ".json") if format == "json" else (_write_text, ".txt")
+            )
+            if not file_name.endswith(suffix):
+                file_name += suffix
+
             # 获取系统信息
             info = {}
-            
+
+            collect_all = info_type == "all"
+
             # 获取操作系统信息
-            if info_type in ["os", "all"]:
-                info["os"] = {
-                    "system": platform.system(),
-                    "release": platform.release(),
-                    "version": platform.version(),
-                    "machine": platform.machine(),
-                    "processor": platform.processor(),
-                    "platform": platform.platform(),
-                    "node": platform.node(),
-                }
-            
-            # 获取CPU信息
-            if info_type in ["cpu", "all"]:
-                info["cpu"] = {
-                    "physical_cores": psutil.cpu_count(logical=False),
-                    "total_cores": psutil.cpu_count(logical=True),
-                    "cpu_percent": psutil.cpu_percent(),
-                    "cpu_freq": {
-                        "current": getattr(psutil.cpu_freq(), "current", None),
-                        "min": getattr(psutil.cpu_freq(), "min", None),
-                        "max": getattr(psutil.cpu_freq(), "max", None),
-                    },
-                }
-            
-            # 获取内存信息
-            if info_type in ["memory", "all"]:
-                mem = psutil.virtual_memory()
-                info["memory"] = {
-                    "total": mem.total,
-                    "available": mem.available,
-                    "used": mem.used,
-                    "percent": mem.percent,
-                }
-            
-            # 获取磁盘信息
-            if info_type in ["disk", "all"]:
-                disk = psutil.disk_usage('/')
-                info["disk"] = {
-                    "total": disk.total,
-                    "used": disk.used,
-                    "free": disk.free,
-                    "percent": disk.percent,
-                }
-            
-            # 根据格式生成内容
-            if format == "json":
-                content = json.dumps(info, indent=2, ensure_ascii=False)
-                if not file_name.endswith('.json'):
-                    file_name += '.json'
+            if collect_all or info_type == "os":
+                info["os"] = get_static_os_info()
+
+            # psutil 调用都会阻塞读取 /proc 或 sysfs，放到线程中并发执行
+            if collect_all:
+                names = list(_COLLECTORS)
             else:
-                # 文本格式
-                content = ""
-                
-                if "os" in info:
-                    content += "操作系统信息:\n"
-                    content += f"  系统: {info['os']['system']}\n"
-                    content += f"  发行版: {info['os']['release']}\n"
-                    content += f"  版本: {info['os']['version']}\n"
-                    content += f"  架构: {info['os']['machine']}\n"
-                    content += f"  处理器: {info['os']['processor']}\n"
-                    content += f"  平台: {info['os']['platform']}\n"
-                    content += f"  节点名: {info['os']['node']}\n\n"
-                
-                if "cpu" in info:
-                    content += "CPU信息:\n"
-                    content += f"  物理核心数: {info['cpu']['physical_cores']}\n"
-                    content += f"  逻辑核心数: {info['cpu']['total_cores']}\n"
-                    content += f"  CPU使用率: {info['cpu']['cpu_percent']}%\n"
-                    if info['cpu']['cpu_freq']['current']:
-                        content += f"  当前频率: {info['cpu']['cpu_freq']['current']} MHz\n"
-                    if info['cpu']['cpu_freq']['min']:
-                        content += f"  最小频率: {info['cpu']['cpu_freq']['min']} MHz\n"
-                    if info['cpu']['cpu_freq']['max']:
-                        content += f"  最大频率: {info['cpu']['cpu_freq']['max']} MHz\n\n"
-                
-                if "memory" in info:
-                    content += "内存信息:\n"
-                    content += f"  总内存: {self._format_bytes(info['memory']['total'])}\n"
-                    content += f"  可用内存: {self._format_bytes(info['memory']['available'])}\n"
-                    content += f"  已用内存: {self._format_bytes(info['memory']['used'])}\n"
-                    content += f"  内存使用率: {info['memory']['percent']}%\n\n"
-                
-                if "disk" in info:
-                    content += "磁盘信息:\n"
-                    content += f"  总空间: {self._format_bytes(info['disk']['total'])}\n"
-                    content += f"  已用空间: {self._format_bytes(info['disk']['used'])}\n"
-                    content += f"  可用空间: {self._format_bytes(info['disk']['free'])}\n"
-                    content += f"  磁盘使用率: {info['disk']['percent']}%\n"
-                
-                if not file_name.endswith('.txt'):
-                    file_name += '.txt'
-            
+                names = [info_type] if info_type in _COLLECTORS else []
+            results = await asyncio.gather(
+                *(asyncio.to_thread(_COLLECTORS[name]) for name in names)
+            )
+            info.update(zip(names, results))
+
             # 获取当前操作系统类型
-            current_os = platform.system()
-            
+            current_os = CURRENT_OS
+
             # 根据操作系统类型选择保存路径
             if current_os == "Windows":
-                base_path = windows_path or os.path.join(os.path.expanduser("~"), "Documents")
+                base_path = windows_path or DOCUMENTS_DIR
             elif current_os == "Darwin":  # macOS
-                base_path = macos_path or os.path.join(os.path.expanduser("~"), "Documents")
+                base_path = macos_path or DOCUMENTS_DIR
             elif current_os == "Linux":
-                base_path = linux_path or os.path.join(os.path.expanduser("~"), "Documents")
+                base_path = linux_path or DOCUMENTS_DIR
             else:
                 # 未知操作系统，使用当前目录
                 base_path = "."
-            
+
             # 构建完整的文件路径
             file_path = os.path.join(base_path, file_name)
-            
-            # 确保目录存在
-            directory = os.path.dirname(file_path)
-            if directory and not os.path.exists(directory):
-                os.makedirs(directory)
-            
-            # 写入文件
-            async with aiofiles.open(file_path, "w", encoding="utf-8") as file:
-                await file.write(content)
-            
+
+            # 确保目录存在并写入文件
+            await asyncio.to_thread(writer, file_path, info)
+
             return ToolResult(output=f"系统信息已成功保存到 {file_path}（操作系统：{current_os}）")
         except Exception as e:
             return ToolResult(error=f"获取或保存系统信息时出错: {str(e)}")
-    
-    def _format_bytes(self, bytes_value):
-        """将字节数格式化为人类可读的形式"""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if bytes_value < 1024.0:
-                return f"{bytes_value:.2f} {unit}"
-            bytes_value /= 1024.0
-        return f"{bytes_value:.2f} PB" 
\ No newline at end of file
@@ -0,0 +1,37 @@
+"""系统信息相关工具共用的辅助函数和常量"""
+
+import os
+import platform
+from functools import lru_cache
+from typing import Dict
+
+
+# 运行期间操作系统和用户目录不会改变，导入时确定一次即可
+CURRENT_OS = platform.system()
+DOCUMENTS_DIR = os.path.join(os.path.expanduser("~"), "Documents")
+
+_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+
+@lru_cache(maxsize=1)
+def get_static_os_info() -> Dict[str, str]:
+    """操作系统信息在进程生命周期内不会变化，只采集一次"""
+    # uname() 一次返回全部字段，只有组合字符串 platform() 需要单独获取
+    uname = platform.uname()
+    return {
+        "system": uname.system,
+        "release": uname.release,
+        "version": uname.version,
+        "machine": uname.machine,
+        "processor": uname.processor,
+        "platform": platform.platform(),
+        "node": uname.node,
+    }
+
+
+def format_bytes(bytes_value) -> str:
+    """将字节数格式化为人类可读的形式"""
+    # 每 1024 倍进一个单位，(bit_length - 1) // 10 直接得到单位下标
+    bits = int(bytes_value).bit_length()
+    exp = min((bits - 1) // 10, len(_UNITS) - 1) if bits else 0
+    return f"{bytes_value / (1 << (exp * 10)):.2f} {_UNITS[exp]}"
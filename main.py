@@ -1,6 +1,7 @@
 import asyncio
 
 from app.agent.manus import Manus
+from app.console import ainput
 from app.logger import logger
 
 
@@ -8,7 +9,7 @@ async def main():
     agent = Manus()
     while True:
         try:
-            prompt = input("Enter your prompt (or 'exit'/'quit' to quit): ")
+            prompt = await ainput("Enter your prompt (or 'exit'/'quit' to quit): ")
             prompt_lower = prompt.lower()
             if prompt_lower in ["exit", "quit"]:
                 logger.info("Goodbye!")
@@ -18,10 +19,14 @@ async def main():
                 continue
             logger.warning("Processing your request...")
             await agent.run(prompt)
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, EOFError):
             logger.warning("Goodbye!")
             break
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        # asyncio.run turns Ctrl-C into cancelling main() and re-raises it here
+        logger.warning("Goodbye!")
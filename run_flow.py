@@ -2,6 +2,7 @@ import asyncio
 import time
 
 from app.agent.manus import Manus
+from app.console import ainput
 from app.flow.base import FlowType
 from app.flow.flow_factory import FlowFactory
 from app.logger import logger
@@ -14,7 +15,7 @@ async def run_flow():
 
     while True:
         try:
-            prompt = input("Enter your prompt (or 'exit' to quit): ")
+            prompt = await ainput("Enter your prompt (or 'exit' to quit): ")
             if prompt.lower() == "exit":
                 logger.info("Goodbye!")
                 break
@@ -45,9 +46,16 @@ async def run_flow():
 
         except KeyboardInterrupt:
             logger.info("Operation cancelled by user.")
+        except EOFError:
+            logger.info("Goodbye!")
+            break
         except Exception as e:
             logger.error(f"Error: {str(e)}")
 
 
 if __name__ == "__main__":
-    asyncio.run(run_flow())
+    try:
+        asyncio.run(run_flow())
+    except KeyboardInterrupt:
+        # asyncio.run turns Ctrl-C into cancelling run_flow() and re-raises it here
+        logger.info("Goodbye!")
@@ -17,7 +17,6 @@ setup(
     install_requires=[
         "pydantic~=2.10.4",
         "openai~=1.58.1",
-        "tenacity~=9.0.0",
         "pyyaml~=6.0.2",
         "loguru~=0.7.3",
         "numpy",
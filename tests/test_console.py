@@ -0,0 +1,179 @@
+import asyncio
+import builtins
+import os
+import signal
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+import app.console
+from app.console import ainput
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# loop.add_reader, POSIX signals and pty only exist off Windows
+posix_only = pytest.mark.skipif(
+    sys.platform == "win32", reason="requires add_reader, POSIX signals and pty"
+)
+
+# Minimal interactive loop mirroring main.py: read prompts until EOF or Ctrl-C
+SCRIPT = """
+import asyncio
+import threading
+
+from app.console import ainput
+
+
+async def main():
+    while True:
+        try:
+            line = await ainput("> ")
+        except EOFError:
+            print("EOF")
+            return
+        print(f"got {line!r}")
+
+
+try:
+    asyncio.run(main())
+except KeyboardInterrupt:
+    # No reader thread may be left blocked on stdin at interpreter shutdown
+    assert threading.active_count() == 1, threading.enumerate()
+    print("Goodbye!")
+"""
+
+
+def _spawn(**kwargs) -> subprocess.Popen:
+    return subprocess.Popen(
+        [sys.executable, "-c", SCRIPT],
+        cwd=ROOT,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        **kwargs,
+    )
+
+
+def _wait_for_prompt(read, timeout: float = 10) -> bytes:
+    output = b""
+    deadline = time.monotonic() + timeout
+    while b"> " not in output and time.monotonic() < deadline:
+        output += read()
+    assert b"> " in output, output
+    return output
+
+
+@posix_only
+def test_reads_lines_until_eof_from_pipe():
+    proc = _spawn(stdin=subprocess.PIPE)
+    out, _ = proc.communicate("first\n中文\nlast".encode(), timeout=10)
+    assert proc.returncode == 0
+    assert out.decode().split("> ")[1:] == [
+        "got 'first'\n",
+        "got '中文'\n",
+        "got 'last'\n",
+        "EOF\n",
+    ]
+
+
+@posix_only
+def test_eof_from_regular_file(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("only\n")
+    with path.open() as stdin:
+        proc = _spawn(stdin=stdin)
+        out, _ = proc.communicate(timeout=10)
+    assert proc.returncode == 0
+    assert out.decode().endswith("got 'only'\n> EOF\n")
+
+
+@posix_only
+def test_ctrl_c_on_open_pipe_exits_cleanly():
+    proc = _spawn(stdin=subprocess.PIPE)
+    _wait_for_prompt(lambda: os.read(proc.stdout.fileno(), 1024))
+    proc.send_signal(signal.SIGINT)
+    out, _ = proc.communicate(timeout=10)
+    assert proc.returncode == 0, out
+    assert out.decode().endswith("Goodbye!\n")
+
+
+@posix_only
+def test_ctrl_c_on_tty_exits_cleanly():
+    import pty
+
+    pid, fd = pty.fork()
+    if pid == 0:
+        os.chdir(ROOT)
+        os.execv(sys.executable, [sys.executable, "-c", SCRIPT])
+    output = _wait_for_prompt(lambda: os.read(fd, 1024))
+    os.write(fd, b"\x03")
+    while True:
+        try:
+            chunk = os.read(fd, 1024)
+        except OSError:  # EIO once the child closes the pty
+            break
+        if not chunk:
+            break
+        output += chunk
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0, output
+    assert b"Goodbye!" in output
+
+
+@pytest.fixture
+def stdin_pipe(monkeypatch):
+    """Point sys.stdin at a fresh pipe and return its write end."""
+    read_fd, write_fd = os.pipe()
+    stdin = open(read_fd, encoding="utf-8", errors="strict")
+    monkeypatch.setattr(sys, "stdin", stdin)
+    monkeypatch.setattr(app.console, "_pending", bytearray())
+    yield write_fd
+    stdin.close()
+    os.close(write_fd)
+
+
+def test_falls_back_to_input_when_stdin_cannot_be_watched(stdin_pipe, monkeypatch):
+    monkeypatch.setattr(builtins, "input", lambda *args: "typed")
+
+    async def run():
+        loop = asyncio.get_running_loop()
+
+        def add_reader(*args):
+            raise NotImplementedError
+
+        monkeypatch.setattr(loop, "add_reader", add_reader)
+        return await ainput()
+
+    assert asyncio.run(run()) == "typed"
+
+
+@posix_only
+def test_decode_error_reaches_caller(stdin_pipe):
+    os.write(stdin_pipe, b"\xff\xfe bad\nok\n")
+
+    async def run():
+        with pytest.raises(UnicodeDecodeError):
+            await asyncio.wait_for(ainput(), 5)
+        return await asyncio.wait_for(ainput(), 5)
+
+    assert asyncio.run(run()) == "ok"
+
+
+@posix_only
+def test_read_error_reaches_caller(stdin_pipe, monkeypatch):
+    os.write(stdin_pipe, b"line\n")
+
+    def read(fd, n):
+        raise OSError(5, "Input/output error")
+
+    monkeypatch.setattr(app.console.os, "read", read)
+
+    async def run():
+        await asyncio.wait_for(ainput(), 5)
+
+    # Not just any OSError: a spinning reader would surface as TimeoutError
+    with pytest.raises(OSError, match="Input/output error"):
+        asyncio.run(run())